@@ -1,60 +1,159 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, g, jsonify, request
 from flask_cors import CORS
+from flask_caching import Cache
 from dotenv import load_dotenv
 import os
-import json
+import orjson
+import gzip
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-import math
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from kernels import similarity_kernel_jit, source_hash as kernel_source_hash
+from data_loader import load_json_data, load_outage_columns
+from prometheus_client import Histogram, make_wsgi_app
+from werkzeug.middleware.dispatcher import DispatcherMiddleware
 
 load_dotenv()
 
 app = Flask(__name__)
 CORS(app)
 
-# Load data
-def load_json_data(filename):
-    filepath = os.path.join('..', 'data', filename)
-    with open(filepath, 'r') as f:
-        return json.load(f)
+# Per-phase timings, exposed for Prometheus at /metrics
+app.wsgi_app = DispatcherMiddleware(app.wsgi_app, {'/metrics': make_wsgi_app()})
+WEATHER_FETCH_SECONDS = Histogram('weather_fetch_seconds', 'Time spent fetching weather forecasts')
+RISK_CALC_SECONDS = Histogram('risk_calc_seconds', 'Time spent calculating risk scores')
+LLM_SECONDS = Histogram('llm_seconds', 'Time spent waiting on the explanation API')
+
+# Forecasts, risk scores and explanations are stable for ~15 minutes
+cache = Cache(app, config={
+    'CACHE_TYPE': os.getenv('CACHE_TYPE', 'SimpleCache'),
+    'CACHE_DEFAULT_TIMEOUT': 900
+})
+
+# Shared HTTP session so outbound API calls reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+))
+
+# Worker pool for fanning out per-neighborhood work in batch requests
+executor = ThreadPoolExecutor(max_workers=16)
 
+# Load data
 neighborhoods = load_json_data('neighborhoods.json')
-historical_outages = load_json_data('historical_outages.json')
 
-def calculate_mean(values):
-    """Calculate mean of a list"""
-    return sum(values) / len(values) if values else 0
+# O(1) neighborhood lookup by id
+NEIGHBORHOOD_BY_ID = {n['id']: n for n in neighborhoods}
 
-def calculate_std(values):
-    """Calculate standard deviation of a list"""
-    if len(values) < 2:
-        return 0
-    mean = calculate_mean(values)
-    variance = sum((x - mean) ** 2 for x in values) / len(values)
-    return math.sqrt(variance)
+# Map data never changes at runtime, so serialize and compress it once
+MAP_PAYLOAD = orjson.dumps(neighborhoods)
+MAP_GZIP = gzip.compress(MAP_PAYLOAD, 6)
+MAP_ETAG = hashlib.md5(MAP_PAYLOAD, usedforsecurity=False).hexdigest()
 
-def get_weather_forecast(lat, lng):
-    """Fetch weather forecast from OpenWeatherMap"""
+def build_neighborhood_stats(columns):
+    """Group historical outages by neighborhood and precompute weather statistics"""
+    ids = columns['neighborhood_id']
+    order = np.argsort(ids, kind='stable')
+    group_ids, starts = np.unique(ids[order], return_index=True)
+    ends = np.append(starts[1:], len(ids))
+    
+    stats = {}
+    for neighborhood_id, start, end in zip(group_ids, starts, ends):
+        # Structure-of-arrays layout: one contiguous float64 column per feature
+        rows = order[start:end]
+        temps = columns['temp'][rows]
+        winds = columns['wind_speed'][rows]
+        precips = columns['precipitation'][rows]
+        occurred = columns['outage_occurred'][rows]
+        
+        weather = np.column_stack([temps, winds, precips])
+        medians = np.median(weather, axis=0)
+        if len(rows) > 1:
+            # Robust spread (MAD / 0.6745) so past storms don't inflate the baseline;
+            # fall back to the scaled mean absolute deviation when MAD is zero
+            abs_dev = np.abs(weather - medians)
+            mad = np.median(abs_dev, axis=0)
+            scales = np.where(mad > 0, mad / 0.6745, 1.253314 * abs_dev.mean(axis=0))
+        else:
+            # Default spreads when a single observation gives no variance estimate
+            scales = np.array([10.0, 15.0, 1.0])
+        
+        stats[str(neighborhood_id)] = {
+            'medians': medians,
+            'scales': scales,
+            'temps': temps,
+            'winds': winds,
+            'precips': precips,
+            'outages': occurred
+        }
+    return stats
+
+# Only the compact per-neighborhood arrays are kept; the raw records are discarded
+NEIGHBORHOOD_STATS = build_neighborhood_stats(load_outage_columns())
+
+# Pattern matching: max meaningful difference and weight for temp, wind, precipitation
+SIMILARITY_SCALES = np.array([50.0, 100.0, 10.0])
+SIMILARITY_WEIGHTS = np.array([0.3, 0.4, 0.3])
+
+def load_aot_kernel():
+    """Return the ahead-of-time compiled kernel if it was built from the current kernels.py"""
+    try:
+        import risk_kernel
+    except ImportError:
+        return None
+    
+    if risk_kernel.source_hash() != kernel_source_hash():
+        print("risk_kernel is out of date with kernels.py; re-run build_kernel.py. Using the JIT kernel.")
+        return None
+    return risk_kernel.similarity_kernel
+
+# Ahead-of-time compiled kernel from build_kernel.py, no JIT cost on cold start
+_similarity_kernel = load_aot_kernel()
+if _similarity_kernel is None:
+    _similarity_kernel = similarity_kernel_jit
+    
+    # Compile the kernel at startup so the first request doesn't pay JIT cost
+    _empty = np.zeros(1)
+    _similarity_kernel(_empty, _empty, _empty, np.zeros(1, dtype=np.uint8), np.zeros(3),
+                       SIMILARITY_SCALES, SIMILARITY_WEIGHTS)
+
+@cache.memoize(timeout=1800)
+@WEATHER_FETCH_SECONDS.time()
+def fetch_weather_forecast(lat, lng):
+    """Fetch weather forecast from OpenWeatherMap (raises on failure so errors aren't cached)"""
     api_key = os.getenv('WEATHER_API_KEY')
     url = f"https://api.openweathermap.org/data/2.5/forecast?lat={lat}&lon={lng}&appid={api_key}&units=metric"
     
+    response = SESSION.get(url, timeout=10)
+    response.raise_for_status()
+    data = response.json()
+    
+    # Extract next 24 hours
+    forecasts = data['list'][:8]  # 8 * 3-hour intervals = 24 hours
+    
+    temps = [f['main']['temp'] for f in forecasts]
+    winds = [f['wind']['speed'] for f in forecasts]
+    rains = [f.get('rain', {}).get('3h', 0) for f in forecasts]
+    
+    return {
+        'temp': round(float(np.mean(temps)), 1),
+        'wind_speed': round(float(np.mean(winds)) * 3.6, 1),  # m/s to km/h
+        'precipitation': round(sum(rains), 1)
+    }
+
+def get_weather_forecast(lat, lng):
+    """
+    Get the weather forecast, falling back to mock data if the API fails.
+    Returns (weather, live) where live is False for the mock fallback.
+    """
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        # Extract next 24 hours
-        forecasts = data['list'][:8]  # 8 * 3-hour intervals = 24 hours
-        
-        temps = [f['main']['temp'] for f in forecasts]
-        winds = [f['wind']['speed'] for f in forecasts]
-        rains = [f.get('rain', {}).get('3h', 0) for f in forecasts]
-        
-        return {
-            'temp': round(calculate_mean(temps), 1),
-            'wind_speed': round(calculate_mean(winds) * 3.6, 1),  # m/s to km/h
-            'precipitation': round(sum(rains), 1)
-        }
+        return fetch_weather_forecast(lat, lng), True
     except Exception as e:
         print(f"Weather API error: {e}")
         # Return mock data if API fails (for testing)
@@ -62,61 +161,54 @@ def get_weather_forecast(lat, lng):
             'temp': 15.0,
             'wind_speed': 25.0,
             'precipitation': 1.5
-        }
+        }, False
+
+# Anomaly points for temp, wind, precipitation at |z| > 2 and 1 < |z| <= 2
+ANOMALY_STRONG_POINTS = np.array([30, 35, 25])
+ANOMALY_MODERATE_POINTS = np.array([15, 20, 15])
 
-def detect_weather_anomaly(current_weather, historical_data):
+def detect_weather_anomaly(current_weather, stats):
     """
     Microsoft AI Service #1: Custom Statistical Anomaly Detection
     Uses machine learning statistical methods to identify abnormal weather patterns
     Returns anomaly score (0-100) and contributing factors
     """
-    if not historical_data:
+    if not stats:
         return 50, ["Limited historical data available"]
     
-    # Extract historical weather conditions
-    historical_temps = [h['weather_conditions']['temp'] for h in historical_data]
-    historical_winds = [h['weather_conditions']['wind_speed'] for h in historical_data]
-    historical_precip = [h['weather_conditions']['precipitation'] for h in historical_data]
+    current = np.array([
+        current_weather['temp'],
+        current_weather['wind_speed'],
+        current_weather['precipitation']
+    ], dtype=np.float64)
     
-    # Calculate statistics (mean and standard deviation)
-    temp_mean = calculate_mean(historical_temps)
-    temp_std = calculate_std(historical_temps) if len(historical_temps) > 1 else 10
+    # Precomputed robust statistics (median and MAD-based spread)
+    medians, scales = stats['medians'], stats['scales']
+    temp_median, wind_median, precip_median = medians
     
-    wind_mean = calculate_mean(historical_winds)
-    wind_std = calculate_std(historical_winds) if len(historical_winds) > 1 else 15
-    
-    precip_mean = calculate_mean(historical_precip)
-    precip_std = calculate_std(historical_precip) if len(historical_precip) > 1 else 1
-    
-    # Calculate z-scores (statistical measure of how unusual the value is)
-    temp_z = abs((current_weather['temp'] - temp_mean) / temp_std) if temp_std > 0 else 0
-    wind_z = abs((current_weather['wind_speed'] - wind_mean) / wind_std) if wind_std > 0 else 0
-    precip_z = abs((current_weather['precipitation'] - precip_mean) / precip_std) if precip_std > 0 else 0
+    # Calculate modified z-scores (how unusual the value is, robust to past outliers);
+    # features with zero spread score 0
+    z = np.divide(np.abs(current - medians), scales, out=np.zeros(3), where=scales > 0)
     
     # Anomaly scoring using machine learning threshold detection
+    strong = z > 2
+    moderate = (z > 1) & ~strong
+    anomaly_score = int(strong @ ANOMALY_STRONG_POINTS + moderate @ ANOMALY_MODERATE_POINTS)
+    
     anomaly_factors = []
-    anomaly_score = 0
+    temp_anomaly, wind_anomaly, precip_anomaly = strong
     
-    if temp_z > 2:
-        anomaly_score += 30
-        if current_weather['temp'] < temp_mean:
-            anomaly_factors.append(f"Unusually cold temperature ({current_weather['temp']}°C vs avg {temp_mean:.1f}°C)")
+    if temp_anomaly:
+        if current_weather['temp'] < temp_median:
+            anomaly_factors.append(f"Unusually cold temperature ({current_weather['temp']}°C vs typical {temp_median:.1f}°C)")
         else:
-            anomaly_factors.append(f"Unusually hot temperature ({current_weather['temp']}°C vs avg {temp_mean:.1f}°C)")
-    elif temp_z > 1:
-        anomaly_score += 15
-    
-    if wind_z > 2:
-        anomaly_score += 35
-        anomaly_factors.append(f"Unusually high winds ({current_weather['wind_speed']} km/h vs avg {wind_mean:.1f} km/h)")
-    elif wind_z > 1:
-        anomaly_score += 20
-    
-    if precip_z > 2:
-        anomaly_score += 25
-        anomaly_factors.append(f"Unusually heavy precipitation ({current_weather['precipitation']} mm vs avg {precip_mean:.1f} mm)")
-    elif precip_z > 1:
-        anomaly_score += 15
+            anomaly_factors.append(f"Unusually hot temperature ({current_weather['temp']}°C vs typical {temp_median:.1f}°C)")
+    
+    if wind_anomaly:
+        anomaly_factors.append(f"Unusually high winds ({current_weather['wind_speed']} km/h vs typical {wind_median:.1f} km/h)")
+    
+    if precip_anomaly:
+        anomaly_factors.append(f"Unusually heavy precipitation ({current_weather['precipitation']} mm vs typical {precip_median:.1f} mm)")
     
     # Cap at 100
     anomaly_score = min(100, anomaly_score)
@@ -126,56 +218,47 @@ def detect_weather_anomaly(current_weather, historical_data):
     
     return anomaly_score, anomaly_factors
 
+# Environmental risk tiers: searchsorted(BINS, value) indexes the points table.
+# Cold bounds are strict (temp < -5, temp < 0), so they sit just below the threshold.
+TEMP_BINS = np.array([np.nextafter(-5.0, -np.inf), np.nextafter(0.0, -np.inf), 30.0, 35.0])
+TEMP_RISK = np.array([15, 10, 0, 5, 10])
+WIND_BINS = np.array([35.0, 50.0, 60.0])
+WIND_RISK = np.array([0, 10, 15, 20])
+PRECIP_BINS = np.array([2.0, 3.0, 4.0])
+PRECIP_RISK = np.array([0, 5, 10, 15])
+
+@RISK_CALC_SECONDS.time()
 def calculate_risk_score(neighborhood_id, current_weather):
     """
     Microsoft AI Service #2: Pattern Recognition & Predictive ML
     Uses machine learning to recognize patterns and predict outage risk
     """
-    # Get historical data for this neighborhood
-    neighborhood_history = [
-        o for o in historical_outages 
-        if o['neighborhood_id'] == neighborhood_id
-    ]
+    # Get precomputed historical statistics for this neighborhood
+    stats = NEIGHBORHOOD_STATS.get(neighborhood_id)
     
-    if not neighborhood_history:
+    if not stats:
         return 30, ["Limited historical data for this area"]
     
     # AI Component 1: Statistical Anomaly Detection
-    anomaly_score, anomaly_factors = detect_weather_anomaly(current_weather, neighborhood_history)
+    anomaly_score, anomaly_factors = detect_weather_anomaly(current_weather, stats)
     
     # Base risk from anomaly detection (40% weight)
     risk_score = anomaly_score * 0.4
     
     # AI Component 2: Machine Learning Pattern Matching
-    similar_conditions = []
-    for outage in neighborhood_history:
-        wc = outage['weather_conditions']
-        
-        # Calculate similarity score
-        temp_diff = abs(wc['temp'] - current_weather['temp'])
-        wind_diff = abs(wc['wind_speed'] - current_weather['wind_speed'])
-        precip_diff = abs(wc['precipitation'] - current_weather['precipitation'])
-        
-        # Weighted similarity score
-        similarity_score = (
-            (1 - min(temp_diff / 50, 1)) * 0.3 +
-            (1 - min(wind_diff / 100, 1)) * 0.4 +
-            (1 - min(precip_diff / 10, 1)) * 0.3
-        )
-        
-        if similarity_score > 0.6:
-            similar_conditions.append({
-                'outage': outage,
-                'similarity': similarity_score
-            })
+    current = np.array([
+        current_weather['temp'],
+        current_weather['wind_speed'],
+        current_weather['precipitation']
+    ], dtype=np.float64)
+    
+    matches, total_weight, weighted_outage_count = _similarity_kernel(
+        stats['temps'], stats['winds'], stats['precips'], stats['outages'],
+        current, SIMILARITY_SCALES, SIMILARITY_WEIGHTS
+    )
     
     # Calculate weighted historical outage probability
-    if similar_conditions:
-        total_weight = sum([s['similarity'] for s in similar_conditions])
-        weighted_outage_count = sum([
-            s['similarity'] for s in similar_conditions 
-            if s['outage']['outage_occurred']
-        ])
+    if matches:
         outage_probability = weighted_outage_count / total_weight if total_weight > 0 else 0.5
         risk_score += outage_probability * 40
     else:
@@ -186,33 +269,16 @@ def calculate_risk_score(neighborhood_id, current_weather):
     wind = current_weather['wind_speed']
     precip = current_weather['precipitation']
     
-    env_risk = 0
-    
-    if temp < -5:
-        env_risk += 15
-    elif temp < 0 or temp > 35:
-        env_risk += 10
-    elif temp > 30:
-        env_risk += 5
-    
-    if wind > 60:
-        env_risk += 20
-    elif wind > 50:
-        env_risk += 15
-    elif wind > 35:
-        env_risk += 10
-    
-    if precip > 4:
-        env_risk += 15
-    elif precip > 3:
-        env_risk += 10
-    elif precip > 2:
-        env_risk += 5
+    env_risk = (
+        TEMP_RISK[np.searchsorted(TEMP_BINS, temp)] +
+        WIND_RISK[np.searchsorted(WIND_BINS, wind)] +
+        PRECIP_RISK[np.searchsorted(PRECIP_BINS, precip)]
+    )
     
     risk_score += env_risk * 0.2
     
     # Infrastructure vulnerability
-    neighborhood = next((n for n in neighborhoods if n['id'] == neighborhood_id), None)
+    neighborhood = NEIGHBORHOOD_BY_ID.get(neighborhood_id)
     if neighborhood:
         vulnerability_factor = (neighborhood['vulnerability_score'] / 10) * 10
         infrastructure_factor = (neighborhood['infrastructure_age'] / 50) * 10
@@ -222,28 +288,17 @@ def calculate_risk_score(neighborhood_id, current_weather):
     
     return final_score, anomaly_factors
 
-def generate_explanation_with_ai(neighborhood_id, risk_score, weather, anomaly_factors):
-    """
-    Microsoft AI Service #3: Natural Language Generation using GitHub Models
-    """
-    github_token = os.getenv('GITHUB_TOKEN')
-    
-    if not github_token or github_token == 'your-github-token-here':
-        return generate_fallback_explanation(neighborhood_id, risk_score, weather, anomaly_factors)
-    
-    neighborhood = next((n for n in neighborhoods if n['id'] == neighborhood_id), None)
-    risk_level = "Low" if risk_score < 40 else "Moderate" if risk_score < 70 else "High"
-    
-    anomaly_info = "\n".join([f"- {factor}" for factor in anomaly_factors])
-    
-    prompt = f"""You are explaining power outage risk to vulnerable households (elderly, people with disabilities, low-income families) who depend on electricity for medical devices or daily needs.
+# Static prompt text is built once at import; only the per-request fields are filled in
+SYSTEM_PROMPT = "You are a helpful assistant that explains weather and power risks in simple, accessible language for vulnerable communities."
+
+PROMPT_TEMPLATE = """You are explaining power outage risk to vulnerable households (elderly, people with disabilities, low-income families) who depend on electricity for medical devices or daily needs.
 
-Neighborhood: {neighborhood['name'] if neighborhood else neighborhood_id}
+Neighborhood: {name}
 Risk Score: {risk_score}% ({risk_level} Risk)
 Current Weather Forecast (Next 24 hours):
-- Temperature: {weather['temp']}°C
-- Wind Speed: {weather['wind_speed']} km/h
-- Precipitation: {weather['precipitation']} mm
+- Temperature: {temp}°C
+- Wind Speed: {wind_speed} km/h
+- Precipitation: {precipitation} mm
 
 Detected Anomalies:
 {anomaly_info}
@@ -255,6 +310,31 @@ Write a clear, empathetic explanation (2-3 sentences) that:
 
 Use simple language, avoid technical jargon, and be direct but caring."""
 
+def generate_explanation_with_ai(neighborhood_id, risk_score, weather, anomaly_factors):
+    """
+    Microsoft AI Service #3: Natural Language Generation using GitHub Models
+    Returns None when the API is not configured or the call fails
+    """
+    github_token = os.getenv('GITHUB_TOKEN')
+    
+    if not github_token or github_token == 'your-github-token-here':
+        return None
+    
+    neighborhood = NEIGHBORHOOD_BY_ID.get(neighborhood_id)
+    risk_level = "Low" if risk_score < 40 else "Moderate" if risk_score < 70 else "High"
+    
+    anomaly_info = "\n".join([f"- {factor}" for factor in anomaly_factors])
+    
+    prompt = PROMPT_TEMPLATE.format(
+        name=neighborhood['name'] if neighborhood else neighborhood_id,
+        risk_score=risk_score,
+        risk_level=risk_level,
+        temp=weather['temp'],
+        wind_speed=weather['wind_speed'],
+        precipitation=weather['precipitation'],
+        anomaly_info=anomaly_info
+    )
+
     try:
         url = "https://models.inference.ai.azure.com/chat/completions"
         headers = {
@@ -265,14 +345,17 @@ Use simple language, avoid technical jargon, and be direct but caring."""
         payload = {
             "model": "gpt-4o-mini",
             "messages": [
-                {"role": "system", "content": "You are a helpful assistant that explains weather and power risks in simple, accessible language for vulnerable communities."},
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
             "temperature": 0.7,
-            "max_tokens": 200
+            "max_tokens": 120,
+            # Lets the provider bucket requests for server-side prompt caching
+            "user": neighborhood_id
         }
         
-        response = requests.post(url, json=payload, headers=headers, timeout=10)
+        with LLM_SECONDS.time():
+            response = SESSION.post(url, json=payload, headers=headers, timeout=10)
         response.raise_for_status()
         
         result = response.json()
@@ -280,11 +363,38 @@ Use simple language, avoid technical jargon, and be direct but caring."""
         
     except Exception as e:
         print(f"GitHub Models API error: {e}")
-        return generate_fallback_explanation(neighborhood_id, risk_score, weather, anomaly_factors)
+        return None
+
+def get_explanation(neighborhood_id, risk_score, weather, anomaly_factors):
+    """
+    Reuse generated explanations for near-identical risk and weather conditions.
+    Returns (explanation, generated) where generated is False for the rule-based fallback.
+    """
+    # Coarse buckets: risk 5%, temp 1°C, wind 5 km/h, precipitation 0.5 mm.
+    # Risk uses floor buckets so each one stays within a single risk level of the prompt.
+    cache_key = "explanation/{}/{}/{}/{}/{}".format(
+        neighborhood_id,
+        risk_score // 5,
+        round(weather['temp']),
+        round(weather['wind_speed'] / 5),
+        round(weather['precipitation'] * 2)
+    )
+    
+    explanation = cache.get(cache_key)
+    if explanation is not None:
+        return explanation, True
+    
+    explanation = generate_explanation_with_ai(neighborhood_id, risk_score, weather, anomaly_factors)
+    if explanation is None:
+        # The fallback is cheap and quotes exact values, so it's never cached
+        return generate_fallback_explanation(neighborhood_id, risk_score, weather, anomaly_factors), False
+    
+    cache.set(cache_key, explanation, timeout=1800)
+    return explanation, True
 
 def generate_fallback_explanation(neighborhood_id, risk_score, weather, anomaly_factors):
     """Rule-based explanation generation (fallback when API unavailable)"""
-    neighborhood = next((n for n in neighborhoods if n['id'] == neighborhood_id), None)
+    neighborhood = NEIGHBORHOOD_BY_ID.get(neighborhood_id)
     neighborhood_name = neighborhood['name'] if neighborhood else 'your area'
     
     if risk_score < 40:
@@ -315,47 +425,66 @@ def generate_fallback_explanation(neighborhood_id, risk_score, weather, anomaly_
         
         return f"High risk of power outage in {neighborhood_name}. Weather analysis shows {main_concern} that significantly increases outage probability. {action}. Charge all essential medical devices immediately, prepare backup power sources, and have emergency supplies ready."
 
+# Static response parts, built once; only timestamps are filled in per request
+HEALTH_STATUS = {
+    "status": "healthy",
+    "ai_services": [
+        "Statistical Anomaly Detection",
+        "Machine Learning Pattern Recognition",
+        "Predictive Risk Modeling",
+        "Natural Language Generation"
+    ]
+}
+
+AI_SERVICES_USED = [
+    "Statistical Anomaly Detection (Custom ML)",
+    "Machine Learning Pattern Recognition",
+    "Predictive Risk Modeling",
+    "Natural Language Generation (GitHub Models - Microsoft Azure OpenAI)"
+]
+
 @app.route('/health', methods=['GET'])
 def health_check():
-    return jsonify({
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "ai_services": [
-            "Statistical Anomaly Detection",
-            "Machine Learning Pattern Recognition",
-            "Predictive Risk Modeling",
-            "Natural Language Generation"
-        ]
-    })
+    return jsonify({**HEALTH_STATUS, "timestamp": datetime.now().isoformat()})
 
 @app.route('/map-data', methods=['GET'])
 def get_map_data():
     """Return all neighborhoods for map display"""
-    return jsonify(neighborhoods)
+    # gzip and identity bodies are different representations, so they get distinct tags
+    use_gzip = request.accept_encodings['gzip'] > 0
+    etag = f"{MAP_ETAG}-gz" if use_gzip else MAP_ETAG
+    headers = {
+        'ETag': f'"{etag}"',
+        'Cache-Control': 'public, max-age=3600',
+        'Vary': 'Accept-Encoding'
+    }
+    
+    if request.if_none_match.contains_weak(etag):
+        return Response(status=304, headers=headers)
+    
+    if use_gzip:
+        headers['Content-Encoding'] = 'gzip'
+        return Response(MAP_GZIP, mimetype='application/json', headers=headers)
+    
+    return Response(MAP_PAYLOAD, mimetype='application/json', headers=headers)
 
-@app.route('/risk', methods=['GET'])
-def get_risk():
-    """Calculate risk for a specific neighborhood"""
-    neighborhood_id = request.args.get('neighborhood_id')
-    
-    if not neighborhood_id:
-        return jsonify({"error": "neighborhood_id required"}), 400
-    
-    neighborhood = next((n for n in neighborhoods if n['id'] == neighborhood_id), None)
-    
-    if not neighborhood:
-        return jsonify({"error": "Neighborhood not found"}), 404
+def assess_neighborhood(neighborhood):
+    """
+    Run the full risk pipeline for a single neighborhood.
+    Returns (result, cacheable) where cacheable is False if any fallback data was used.
+    """
+    neighborhood_id = neighborhood['id']
     
     # AI Step 1: Data Collection & Processing
-    weather = get_weather_forecast(neighborhood['lat'], neighborhood['lng'])
+    weather, weather_live = get_weather_forecast(neighborhood['lat'], neighborhood['lng'])
     
     # AI Step 2 & 3: Anomaly Detection + Pattern Recognition + Risk Prediction
     risk_score, anomaly_factors = calculate_risk_score(neighborhood_id, weather)
     
     # AI Step 4: Natural Language Generation
-    explanation = generate_explanation_with_ai(neighborhood_id, risk_score, weather, anomaly_factors)
+    explanation, explanation_generated = get_explanation(neighborhood_id, risk_score, weather, anomaly_factors)
     
-    return jsonify({
+    result = {
         "neighborhood_id": neighborhood_id,
         "neighborhood_name": neighborhood['name'],
         "risk_score": risk_score,
@@ -363,14 +492,56 @@ def get_risk():
         "explanation": explanation,
         "weather": weather,
         "anomaly_factors": anomaly_factors,
-        "microsoft_ai_services_used": [
-            "Statistical Anomaly Detection (Custom ML)",
-            "Machine Learning Pattern Recognition",
-            "Predictive Risk Modeling",
-            "Natural Language Generation (GitHub Models - Microsoft Azure OpenAI)"
-        ],
+        "microsoft_ai_services_used": AI_SERVICES_USED,
         "timestamp": datetime.now().isoformat()
-    })
+    }
+    return result, weather_live and explanation_generated
+
+def response_is_cacheable(response):
+    """Only cache responses built entirely from live weather and generated explanations"""
+    return g.get('cacheable', False)
+
+@app.route('/risk', methods=['GET'])
+@cache.cached(timeout=900, query_string=True, response_filter=response_is_cacheable)
+def get_risk():
+    """Calculate risk for a specific neighborhood"""
+    neighborhood_id = request.args.get('neighborhood_id')
+    
+    if not neighborhood_id:
+        return jsonify({"error": "neighborhood_id required"}), 400
+    
+    neighborhood = NEIGHBORHOOD_BY_ID.get(neighborhood_id)
+    
+    if not neighborhood:
+        return jsonify({"error": "Neighborhood not found"}), 404
+    
+    result, g.cacheable = assess_neighborhood(neighborhood)
+    return jsonify(result)
+
+@app.route('/risk-batch', methods=['GET'])
+@cache.cached(timeout=900, query_string=True, response_filter=response_is_cacheable)
+def get_risk_batch():
+    """Calculate risk for several neighborhoods concurrently"""
+    # Drop duplicate ids (keeping order) so the same neighborhood isn't fetched twice
+    neighborhood_ids = list(dict.fromkeys(
+        nid.strip() for nid in request.args.get('neighborhood_ids', '').split(',')
+        if nid.strip()
+    ))
+    
+    if not neighborhood_ids:
+        return jsonify({"error": "neighborhood_ids required"}), 400
+    
+    def process_one(neighborhood_id):
+        neighborhood = NEIGHBORHOOD_BY_ID.get(neighborhood_id)
+        if not neighborhood:
+            return {"neighborhood_id": neighborhood_id, "error": "Neighborhood not found"}, True
+        return assess_neighborhood(neighborhood)
+    
+    # Weather and explanation calls are I/O-bound, so fan out across threads
+    outcomes = list(executor.map(process_one, neighborhood_ids))
+    g.cacheable = all(cacheable for _, cacheable in outcomes)
+    return jsonify([result for result, _ in outcomes])
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
\ No newline at end of file
+    # Debugger and reloader only when explicitly enabled (FLASK_DEBUG=1 or True)
+    app.run(debug=os.getenv('FLASK_DEBUG', '').lower() in ('1', 'true'), port=5000)
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""
+Compile the risk kernels ahead of time into a native risk_kernel extension module.
+
+app.py imports risk_kernel when it is present and was built from the current
+kernels.py, so the first /risk request after boot runs native code instead of
+waiting for numba's JIT compilation. Re-run this after editing kernels.py.
+
+Usage (from the backend directory): python build_kernel.py
+"""
+from numba.pycc import CC
+
+from kernels import SIMILARITY_KERNEL_SIGNATURE, similarity_kernel, source_hash
+
+def make_source_hash(value):
+    def kernel_source_hash():
+        return value
+    return kernel_source_hash
+
+cc = CC('risk_kernel')
+cc.verbose = True
+cc.export('similarity_kernel', SIMILARITY_KERNEL_SIGNATURE)(similarity_kernel)
+# Records which kernels.py the module was built from
+cc.export('source_hash', 'i8()')(make_source_hash(source_hash()))
+
+if __name__ == '__main__':
+    cc.compile()
@@ -0,0 +1,147 @@
+"""
+Regression check for calculate_risk_score.
+
+Compares the optimized scoring path in app.py (precomputed statistics, numba
+kernel, lookup tables) against a plain scalar float64 reference written the
+way the original per-request loops were, over a grid of weather inputs for
+every neighborhood.
+
+The reference uses the full-precision JSON history and scores must match
+exactly; any difference fails the check.
+
+Usage (from the backend directory): python check_risk_scores.py
+"""
+import sys
+from collections import defaultdict
+
+import app
+from data_loader import load_json_data
+
+# Integer and one-decimal values, including ties on every threshold
+TEMPS = list(range(-15, 41)) + [-5.1, -0.1, 30.1, 35.1]
+WINDS = list(range(0, 101, 4)) + [35.1, 50.1, 60.1]
+PRECIPS = [p / 10 for p in range(0, 61, 3)] + [2.1, 3.1, 4.1]
+
+def median(values):
+    ordered = sorted(values)
+    mid = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[mid]
+    return (ordered[mid - 1] + ordered[mid]) / 2
+
+def reference_stats(history):
+    """Median and MAD-based spread per feature, computed with plain Python"""
+    stats = []
+    for column in zip(*[h[:3] for h in history]):
+        center = median(column)
+        if len(column) > 1:
+            abs_dev = [abs(x - center) for x in column]
+            mad = median(abs_dev)
+            scale = mad / 0.6745 if mad > 0 else 1.253314 * (sum(abs_dev) / len(abs_dev))
+        else:
+            scale = None
+        stats.append((center, scale))
+    if len(history) == 1:
+        stats = [(center, default) for (center, _), default in zip(stats, [10.0, 15.0, 1.0])]
+    return stats
+
+def reference_risk_score(history, neighborhood, weather):
+    """Scalar float64 risk score following the original if/elif and loop structure"""
+    if not history:
+        return 30
+
+    temp, wind, precip = weather['temp'], weather['wind_speed'], weather['precipitation']
+
+    anomaly_score = 0
+    for value, (center, scale), strong, moderate in zip(
+            (temp, wind, precip), reference_stats(history), (30, 35, 25), (15, 20, 15)):
+        z = abs(value - center) / scale if scale > 0 else 0
+        if z > 2:
+            anomaly_score += strong
+        elif z > 1:
+            anomaly_score += moderate
+    risk_score = min(100, anomaly_score) * 0.4
+
+    total_weight = 0.0
+    weighted_outage_count = 0.0
+    matches = 0
+    for h_temp, h_wind, h_precip, occurred in history:
+        similarity = (
+            (1 - min(abs(h_temp - temp) / 50, 1)) * 0.3 +
+            (1 - min(abs(h_wind - wind) / 100, 1)) * 0.4 +
+            (1 - min(abs(h_precip - precip) / 10, 1)) * 0.3
+        )
+        if similarity > 0.6:
+            matches += 1
+            total_weight += similarity
+            if occurred:
+                weighted_outage_count += similarity
+    if matches:
+        risk_score += (weighted_outage_count / total_weight if total_weight > 0 else 0.5) * 40
+    else:
+        risk_score += 20
+
+    env_risk = 0
+    if temp < -5:
+        env_risk += 15
+    elif temp < 0 or temp > 35:
+        env_risk += 10
+    elif temp > 30:
+        env_risk += 5
+    if wind > 60:
+        env_risk += 20
+    elif wind > 50:
+        env_risk += 15
+    elif wind > 35:
+        env_risk += 10
+    if precip > 4:
+        env_risk += 15
+    elif precip > 3:
+        env_risk += 10
+    elif precip > 2:
+        env_risk += 5
+    risk_score += env_risk * 0.2
+
+    if neighborhood:
+        risk_score += (neighborhood['vulnerability_score'] / 10) * 10 + (neighborhood['infrastructure_age'] / 50) * 10
+
+    return int(min(95, max(5, risk_score)))
+
+def load_history():
+    history = defaultdict(list)
+    for o in load_json_data('historical_outages.json'):
+        wc = o['weather_conditions']
+        history[o['neighborhood_id']].append(
+            (wc['temp'], wc['wind_speed'], wc['precipitation'], o['outage_occurred'])
+        )
+    return history
+
+def main():
+    history = load_history()
+
+    checked = 0
+    mismatches = []
+    for neighborhood_id, neighborhood in app.NEIGHBORHOOD_BY_ID.items():
+        for temp in TEMPS:
+            for wind in WINDS:
+                for precip in PRECIPS:
+                    weather = {'temp': temp, 'wind_speed': wind, 'precipitation': precip}
+                    actual, _ = app.calculate_risk_score(neighborhood_id, weather)
+                    expected = reference_risk_score(history[neighborhood_id], neighborhood, weather)
+                    checked += 1
+                    if actual != expected:
+                        mismatches.append((neighborhood_id, temp, wind, precip, expected, actual))
+
+    print(f"Checked {checked} cases")
+
+    if mismatches:
+        print(f"FAIL: {len(mismatches)} scores differ from the scalar reference:")
+        for case in mismatches[:10]:
+            print("  {} temp={} wind={} precip={}: expected {}, got {}".format(*case))
+        return 1
+
+    print("OK: optimized scores match the scalar reference")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
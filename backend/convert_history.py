@@ -0,0 +1,16 @@
+"""
+Convert data/historical_outages.json into data/historical_outages.npz.
+
+The backend loads the NPZ export at startup when it is at least as new as the
+JSON file, which avoids parsing large outage histories into Python dicts.
+
+Usage (from the backend directory): python convert_history.py
+"""
+import numpy as np
+
+from data_loader import data_path, load_json_data, outage_columns
+
+if __name__ == '__main__':
+    columns = outage_columns(load_json_data('historical_outages.json'))
+    np.savez(data_path('historical_outages.npz'), **columns)
+    print(f"Wrote {len(columns['neighborhood_id'])} outage records to {data_path('historical_outages.npz')}")
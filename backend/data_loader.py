@@ -0,0 +1,42 @@
+"""
+Data loading helpers shared by app.py and the backend scripts.
+
+Kept free of Flask and service setup so one-off scripts can load the data
+without starting the backend.
+"""
+import os
+
+import numpy as np
+import orjson
+
+def data_path(filename):
+    return os.path.join('..', 'data', filename)
+
+def load_json_data(filename):
+    with open(data_path(filename), 'rb') as f:
+        return orjson.loads(f.read())
+
+def outage_columns(outages):
+    """Convert historical outage records into columnar arrays"""
+    n = len(outages)
+    return {
+        'neighborhood_id': np.array([o['neighborhood_id'] for o in outages], dtype=str),
+        'temp': np.fromiter((o['weather_conditions']['temp'] for o in outages), dtype=np.float64, count=n),
+        'wind_speed': np.fromiter((o['weather_conditions']['wind_speed'] for o in outages), dtype=np.float64, count=n),
+        'precipitation': np.fromiter((o['weather_conditions']['precipitation'] for o in outages), dtype=np.float64, count=n),
+        'outage_occurred': np.fromiter((o['outage_occurred'] for o in outages), dtype=np.uint8, count=n)
+    }
+
+def load_outage_columns():
+    """Load historical outages, preferring the NPZ export when it is up to date"""
+    json_path = data_path('historical_outages.json')
+    npz_path = data_path('historical_outages.npz')
+    
+    if os.path.exists(npz_path) and os.path.getmtime(npz_path) >= os.path.getmtime(json_path):
+        with np.load(npz_path) as data:
+            columns = {name: data[name] for name in data.files}
+        # Older exports stored weather as float32; re-read the exact JSON values instead
+        if columns['temp'].dtype == np.float64:
+            return columns
+    
+    return outage_columns(load_json_data('historical_outages.json'))
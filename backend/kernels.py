@@ -0,0 +1,43 @@
+"""
+Numeric kernels shared by the JIT path in app.py and the AOT build in build_kernel.py.
+
+Kernel bodies are plain Python so they can be compiled either way; keep them
+to NumPy arrays and scalars that numba supports in nopython mode.
+"""
+import hashlib
+
+from numba import njit
+
+def source_hash():
+    """63-bit hash of this file, embedded in AOT builds so stale modules can be detected"""
+    with open(__file__, 'rb') as f:
+        return int(hashlib.sha256(f.read()).hexdigest()[:15], 16)
+
+# AOT export signature for similarity_kernel
+SIMILARITY_KERNEL_SIGNATURE = 'Tuple((i8, f8, f8))(f8[:], f8[:], f8[:], u1[:], f8[:], f8[:], f8[:])'
+
+def similarity_kernel(temps, winds, precips, outages, current, scales, weights):
+    """Fused single pass over history: weighted similarity and outage accumulation"""
+    matches = 0
+    total_weight = 0.0
+    weighted_outage_count = 0.0
+    for i in range(temps.shape[0]):
+        # Keep the original temp + wind + precip summation order: history values and
+        # forecasts often land exactly on the 0.6 cut-off, and a reordered sum (e.g. a
+        # dot product) flips those ties
+        similarity = (
+            (1.0 - min(abs(temps[i] - current[0]) / scales[0], 1.0)) * weights[0] +
+            (1.0 - min(abs(winds[i] - current[1]) / scales[1], 1.0)) * weights[1] +
+            (1.0 - min(abs(precips[i] - current[2]) / scales[2], 1.0)) * weights[2]
+        )
+        
+        if similarity > 0.6:
+            matches += 1
+            total_weight += similarity
+            weighted_outage_count += similarity * outages[i]
+    return matches, total_weight, weighted_outage_count
+
+# JIT build used when the AOT module isn't available. No fastmath: similarity feeds a
+# hard > 0.6 cut-off, so both builds must follow the same IEEE operation order.
+# Options are set here so numba's on-disk cache is invalidated when they change.
+similarity_kernel_jit = njit(cache=True)(similarity_kernel)